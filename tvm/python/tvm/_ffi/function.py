@@ -80,7 +80,7 @@ class ModuleBase(object):
         self._entry = self.get_function(self.entry_name)
         return self._entry
 
-    def get_function(self, name, query_imports=False):
+    def get_function(self, name, query_imports=False, allow_missing=False):
         """Get function from the module.
 
         Parameters
@@ -91,10 +91,13 @@ class ModuleBase(object):
         query_imports : bool
             Whether also query modules imported by this module.
 
+        allow_missing : bool
+            Whether allow missing function or raise an error.
+
         Returns
         -------
         f : Function
-            The result function.
+            The result function, None if function is missing.
         """
         ret_handle = FunctionHandle()
         check_call(_LIB.TVMModGetFunction(
@@ -102,6 +105,8 @@ class ModuleBase(object):
             ctypes.c_int(query_imports),
             ctypes.byref(ret_handle)))
         if not ret_handle.value:
+            if allow_missing:
+                return None
             raise AttributeError(
                 "Module has no function '%s'" %  name)
         return Function(ret_handle, False)
@@ -1,10 +1,17 @@
 """Minimum graph runtime that executes graph containing TVM PackedFunc."""
 from __future__ import print_function
+import ctypes
+import json
+import logging
+import numpy as np
 from .._ffi.base import string_types
 from .._ffi.function import get_global_func
+from .._ffi.ndarray import _make_array, numpyasarray
 from .rpc import base as rpc_base
 from .. import ndarray as nd
 
+logger = logging.getLogger(__name__)
+
 
 def create(graph_json_str, libmod, ctx, debug=False):
     """Create a runtime executor module given a graph and module.
@@ -30,7 +37,7 @@ def create(graph_json_str, libmod, ctx, debug=False):
     graph_module : GraphModule
         Runtime graph module that can be used to execute the graph.
     """
-    print("graph_runtime.py create debug_flag =", debug)
+    logger.debug("graph_runtime.create debug=%s", debug)
     if not isinstance(graph_json_str, string_types):
         try:
             graph_json_str = graph_json_str._tvm_graph_json()
@@ -51,6 +58,13 @@ def create(graph_json_str, libmod, ctx, debug=False):
     return GraphModule(func_obj, ctx, graph_json_str, debug)
 
 
+_CPU_DEVICE_TYPE = nd.cpu(0).device_type
+
+# Runtime module functions cached by GraphModule as "_" + name.
+_FUNC_NAMES = ("set_input", "run", "get_output", "get_input", "set_debug_buffer",
+               "load_params", "get_input_names", "get_output_names")
+
+
 class GraphModule(object):
     """Wrapper runtime module.
 
@@ -73,39 +87,36 @@ class GraphModule(object):
 
     ctx : TVMContext
         The context this module is under
+
+    debug_verbose : bool
+        Whether run() prints every debug buffer in debug mode
     """
+    __slots__ = ("module", "_set_input", "_run", "_get_output", "_get_input",
+                 "_set_debug_buffer", "_debug_get_output", "_load_params",
+                 "_get_input_names", "_get_output_names", "ctx", "debug",
+                 "debug_verbose", "graph_json_str", "ndarraylist",
+                 "_debug_buffers_set", "_input_cache")
+
     def __init__(self, module, ctx, graph_json_str, debug):
         self.module = module
-        self._set_input = module["set_input"]
-        self._run = module["run"]
-        self._get_output = module["get_output"]
-        self._get_input = module["get_input"]
-        self._set_debug_buffer = module["set_debug_buffer"]
-        try:
-            self._debug_get_output = module["debug_get_output"]
-        except AttributeError:
-            pass
-        self._load_params = module["load_params"]
-        self._get_input_names = module["get_input_names"]
-        self._get_output_names = module["get_output_names"]
+        for name in _FUNC_NAMES:
+            setattr(self, "_" + name, module[name])
+        debug_get_output = module.get_function("debug_get_output", allow_missing=True)
+        if debug_get_output is not None:
+            self._debug_get_output = debug_get_output
         self.ctx = ctx
         self.debug = debug
+        self._input_cache = {}
+        self.debug_verbose = False
+        self._debug_buffers_set = False
         if self.debug:
             self.graph_json_str = graph_json_str #For CLI Debug
-            graph_json = graph_json_str
-            alpha = 'list_shape'
-            startpos = graph_json.find(alpha) + len(alpha) + 4
-            endpos = graph_json.find(']]', startpos)
-            shapes_str = graph_json[startpos:(endpos + 1)]
-            shape_startpos = shape_endpos = 0
-            self.ndarraylist = []
-            dtype = 'float32' #TODO: dtype parse from json
-            while shape_endpos < endpos - startpos:
-                shape_startpos = shapes_str.find('[', shape_startpos) + 1
-                shape_endpos = shapes_str.find(']', shape_startpos)
-                shape_str = shapes_str[shape_startpos:shape_endpos]
-                shape_list = [int(x) for x in shape_str.split(',')]
-                self.ndarraylist.append(nd.empty(shape_list, dtype))
+            graph_attrs = json.loads(graph_json_str)["attrs"]
+            shapes = graph_attrs["shape"][1]
+            dtypes = graph_attrs["dltype"][1]
+            # Debug buffers stay on the host, DebugRun reads them directly.
+            self.ndarraylist = [nd.empty(shape, dtype)
+                                for shape, dtype in zip(shapes, dtypes)]
 
     def set_input(self, key=None, value=None, **params):
         """Set inputs to the module via kwargs
@@ -122,11 +133,45 @@ class GraphModule(object):
            Additonal arguments
         """
         if key:
-            self._set_input(key, nd.array(value, ctx=self.ctx))
+            self._set_input_value(key, value)
         for k, v in params.items():
-            self._set_input(k, nd.array(v, ctx=self.ctx))
+            self._set_input_value(k, v)
         return self
 
+    def _set_input_value(self, key, value):
+        """Copy value into the graph input key."""
+        if (self.ctx.device_type == _CPU_DEVICE_TYPE and isinstance(value, np.ndarray)
+                and value.flags['C_CONTIGUOUS'] and value.dtype.isnative):
+            # The runtime copies the input into its own storage, so a
+            # temporary view of the numpy data is enough on cpu. The view
+            # records only the dtype name, so it needs native byte order.
+            arr, _ = numpyasarray(value)
+            self._set_input(key, _make_array(ctypes.pointer(arr), True))
+        else:
+            self._set_input(key, self._input_array(key, value))
+
+    def _input_array(self, key, value):
+        """Get an NDArray holding value that the runtime can copy from.
+
+        NDArrays on self.ctx, or on the local cpu for a local module, are used
+        as is. Other values go through a staging buffer per input key, which
+        is kept and refilled as long as the shape and dtype do not change.
+        """
+        if isinstance(value, nd.NDArray) and (
+                value.ctx == self.ctx or
+                (value.ctx.device_type == _CPU_DEVICE_TYPE and
+                 self.ctx.device_type < rpc_base.RPC_SESS_MASK)):
+            return value
+        if not isinstance(value, (np.ndarray, nd.NDArray)):
+            value = np.array(value)
+        # The numpy dtype name drops the byte order, copyfrom converts it.
+        dtype = value.dtype.name if isinstance(value, np.ndarray) else value.dtype
+        buf = self._input_cache.get(key)
+        if buf is None or buf.shape != value.shape or buf.dtype != dtype:
+            buf = nd.empty(value.shape, dtype, self.ctx)
+            self._input_cache[key] = buf
+        return buf.copyfrom(value)
+
     def set_debug_buffer(self):
         """Set the debug out buffers for each tvm nodes
 
@@ -138,16 +183,20 @@ class GraphModule(object):
         if not hasattr(self, '_set_debug_buffer'):#TODO Remove later
             raise RuntimeError("Please compile runtime with USE_GRAPH_RUNTIME_DEBUG = 0")
 
-        for ndbuffer in self.ndarraylist:
-            self._set_debug_buffer(ndbuffer)
+        self._set_debug_buffer(*self.ndarraylist)
+        self._debug_buffers_set = True
+
     def print_array(self, ndbuffer):
+        """Print the shape and the first 10 elements of a debug buffer
+
+        Parameters
+        ----------
+        ndbuffer : NDArray
+            The buffer to print.
+        """
         np_array = ndbuffer.asnumpy()
         print(" ")
-        print(np_array.shape, end=' ')
-        np_array = np_array.flatten()
-        size = np_array.size
-        for i in range (min(10, size)):
-            print(np_array[i], end=', ')
+        print(np_array.shape, np.array2string(np_array.ravel()[:10], separator=', '))
 
     def run(self, **input_dict):
         """Run forward execution of the graph
@@ -160,10 +209,10 @@ class GraphModule(object):
         if input_dict:
             self.set_input(**input_dict)
 
-        if self.debug:
+        if self.debug and not self._debug_buffers_set:
             self.set_debug_buffer()
         self._run()
-        if self.debug:
+        if self.debug and self.debug_verbose:
             for ndbuffer in self.ndarraylist:
                 self.print_array(ndbuffer)
 
@@ -220,7 +269,9 @@ class GraphModule(object):
         params_bytes : bytearray
             The serialized parameter dict.
         """
-        self._load_params(bytearray(params_bytes))
+        if not isinstance(params_bytes, bytearray):
+            params_bytes = bytearray(params_bytes)
+        self._load_params(params_bytes)
 
     def __getitem__(self, key):
         """Get internal module function
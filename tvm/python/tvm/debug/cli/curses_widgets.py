@@ -12,6 +12,27 @@ def PRINT(txt=""):
 RL = debugger_cli_common.RichLine
 
 
+def _concat_rich_lines(rich_lines):
+  """Concatenate a list of RichLines into one, copying each text only once.
+
+  Args:
+    rich_lines: a list of `debugger_cli_common.RichLine` objects.
+
+  Returns:
+    A new `debugger_cli_common.RichLine` equal to summing `rich_lines`.
+  """
+  ret = RL()
+  texts = []
+  offset = 0
+  for line in rich_lines:
+    texts.append(line.text)
+    for start, end, font_attr in line.font_attr_segs:
+      ret.font_attr_segs.append((offset + start, offset + end, font_attr))
+    offset += len(line.text)
+  ret.text = "".join(texts)
+  return ret
+
+
 class NavigationHistoryItem(object):
   """Individual item in navigation history."""
 
@@ -63,12 +84,11 @@ class CursesNavigationHistory(object):
       scroll_position: (`int`) scroll position in the screen output.
     """
     PRINT()
-    if self._pointer + 1 < len(self._items):
-      self._items = self._items[:self._pointer + 1]
+    del self._items[self._pointer + 1:]
     self._items.append(
         NavigationHistoryItem(command, screen_output, scroll_position))
     if len(self._items) > self._capacity:
-      self._items = self._items[-self._capacity:]
+      del self._items[:len(self._items) - self._capacity]
     self._pointer = len(self._items) - 1
 
   def update_scroll_position(self, new_scroll_position):
@@ -174,29 +194,33 @@ class CursesNavigationHistory(object):
 
     """
     PRINT()
-    output = RL("| ")
-    output += RL(
-        self.BACK_ARROW_TEXT,
-        (debugger_cli_common.MenuItem(None, backward_command)
-         if self.can_go_back() else None))
-    output += RL(" ")
-    output += RL(
-        self.FORWARD_ARROW_TEXT,
-        (debugger_cli_common.MenuItem(None, forward_command)
-         if self.can_go_forward() else None))
+    parts = [
+        RL("| "),
+        RL(self.BACK_ARROW_TEXT,
+           (debugger_cli_common.MenuItem(None, backward_command)
+            if self.can_go_back() else None)),
+        RL(" "),
+        RL(self.FORWARD_ARROW_TEXT,
+           (debugger_cli_common.MenuItem(None, forward_command)
+            if self.can_go_forward() else None))]
+    output_len = sum(len(part) for part in parts)
 
     if self._items:
+      latest_pointer = len(self._items) - 1
       command_attribute = (latest_command_attribute
-                           if (self._pointer == (len(self._items) - 1))
+                           if self._pointer == latest_pointer
                            else old_command_attribute)
-      output += RL(" | ")
-      if self._pointer != len(self._items) - 1:
-        output += RL("(-%d) " % (len(self._items) - 1 - self._pointer),
-                     command_attribute)
-
-      if len(output) < max_length:
+      parts.append(RL(" | "))
+      output_len += len(parts[-1])
+      if self._pointer != latest_pointer:
+        parts.append(RL("(-%d) " % (latest_pointer - self._pointer),
+                        command_attribute))
+        output_len += len(parts[-1])
+
+      if output_len < max_length:
         maybe_truncated_command = self._items[self._pointer].command[
-            :(max_length - len(output))]
-        output += RL(maybe_truncated_command, command_attribute)
+            :(max_length - output_len)]
+        parts.append(RL(maybe_truncated_command, command_attribute))
 
+    output = _concat_rich_lines(parts)
     return debugger_cli_common.rich_text_lines_from_rich_line_list([output])
@@ -166,7 +166,7 @@ class DFSGraphTracer(object):
     self._skip_node_names = skip_node_names
 
     self._inputs = []
-    self._visited_nodes = []
+    self._visited_nodes = set()
     self._depth_count = 0
     self._depth_list = []
 
@@ -194,7 +194,7 @@ class DFSGraphTracer(object):
     if node_name in self._visited_nodes:
       return
 
-    self._visited_nodes.append(node_name)
+    self._visited_nodes.add(node_name)
 
     for input_list in self._input_lists:
       if node_name not in input_list:
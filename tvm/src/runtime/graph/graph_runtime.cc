@@ -7,6 +7,7 @@
 #include <dmlc/memory_io.h>
 #include <dmlc/json.h>
 #include <numeric>
+#include <unordered_map>
 #include "./graph_runtime.h"
 #include <cmath>
 
@@ -63,22 +64,17 @@ class GraphRuntime : public ModuleNode {
   }
 
   void DebugRun() {
-    // setup the array and requirements.
-    size_t from_size = 0;
-
-    for (size_t i = 0; i < op_execs_.size(); ++i) {
-      if (op_execs_[i]) op_execs_[i]();
-
-      //from_size = GetDataSize(&data_entry_[i]);
-      //printf("\nRunning nodes %ld output_size=%ld", i, from_size);
-
-      PrintNode(&nodes_[i]);
-      //printf("\nbefore editing val0= %f", ((float *)data_entry_[i].data)[0]);
-      //((float *)data_entry_[i].data)[0] = 0.1111;
-      //printf(" after editing val0= %f", ((float *)data_entry_[i].data)[0]);
-      TVM_CCALL(TVMArrayCopyFromTo(&data_entry_[i], debug_buffers_[i], nullptr));
-      PrintDlTensor(debug_buffers_[i]);
-      CheckNanOrInf(debug_buffers_[i], (CHECK_NONE));
+    CHECK_GE(debug_buffers_.size(), num_node_entries())
+        << "debug buffers are not set for every node entry";
+    for (uint32_t nid = 0; nid < op_execs_.size(); ++nid) {
+      if (op_execs_[nid]) op_execs_[nid]();
+
+      PrintNode(&nodes_[nid]);
+      for (uint32_t eid = entry_id(nid, 0); eid < entry_id(nid + 1, 0); ++eid) {
+        TVM_CCALL(TVMArrayCopyFromTo(&data_entry_[eid], debug_buffers_[eid], nullptr));
+        PrintDlTensor(debug_buffers_[eid]);
+        CheckNanOrInf(debug_buffers_[eid], (CHECK_NONE));
+      }
     }
   }
   /*!
@@ -101,6 +97,7 @@ class GraphRuntime : public ModuleNode {
     module_ = module;
     ctx_ = ctx;
     debug_ = debug;
+    this->SetupNameIndex();
     this->SetupStorage();
     this->SetupOpExecs();
   }
@@ -110,11 +107,9 @@ class GraphRuntime : public ModuleNode {
    * \return The index of input.
    */
   int GetInputIndex(const std::string& name) {
-    for (size_t i = 0; i< input_nodes_.size(); ++i) {
-      uint32_t nid = input_nodes_[i];
-      if (nodes_[nid].name == name) {
-        return static_cast<int>(i);
-      }
+    auto it = input_map_.find(name);
+    if (it != input_map_.end()) {
+      return static_cast<int>(it->second);
     }
     LOG(WARNING) << "Warning: cannot find \"" << name << "\" among input";
     return -1;
@@ -251,10 +246,9 @@ class GraphRuntime : public ModuleNode {
    * \return The index of node.
    */
   int GetNodeIndex(const std::string& name) {
-    for (uint32_t nid = 0; nid< nodes_.size(); ++nid) {
-      if (nodes_[nid].name == name) {
-        return static_cast<int>(nid);
-      }
+    auto it = node_map_.find(name);
+    if (it != node_map_.end()) {
+      return static_cast<int>(it->second);
     }
     LOG(FATAL) << "cannot find " << name << " among nodex";
     return -1;
@@ -272,7 +266,7 @@ class GraphRuntime : public ModuleNode {
    */
   void DebugGetNodeOutput(int index, DLTensor* data_out) {
     CHECK_LT(static_cast<size_t>(index), nodes_.size());
-    uint32_t eid = index;
+    uint32_t eid = this->entry_id(index, 0);
 
     for (size_t i = 0; i < op_execs_.size(); ++i) {
       if (op_execs_[i]) op_execs_[i]();
@@ -469,6 +463,8 @@ class GraphRuntime : public ModuleNode {
       CHECK_EQ(bitmask, 1|2|4|8|16) << "invalid format";
   }
   void LoadDLTensor(dmlc::Stream* strm, DLTensor* tensor);
+  /*! \brief Setup the name to index lookup tables */
+  void SetupNameIndex();
   /*! \brief Setup the temporal storage */
   void SetupStorage();
   /*! \brief Setup the executors */
@@ -518,6 +514,10 @@ class GraphRuntime : public ModuleNode {
   tvm::runtime::Module module_;
   /*! \brief execution context */
   TVMContext ctx_;
+  /*! \brief node name to node index */
+  std::unordered_map<std::string, uint32_t> node_map_;
+  /*! \brief input node name to input index */
+  std::unordered_map<std::string, uint32_t> input_map_;
   /*! \brief common storage pool */
   std::vector<DLTensor*> storage_pool_;
   /*! \brief data entry of each node */
@@ -602,6 +602,18 @@ void GraphRuntime::LoadParams(dmlc::Stream* strm) {
   }
 }
 
+void GraphRuntime::SetupNameIndex() {
+  // keep the first match to preserve the old linear-scan semantics.
+  node_map_.clear();
+  for (uint32_t nid = 0; nid < nodes_.size(); ++nid) {
+    node_map_.emplace(nodes_[nid].name, nid);
+  }
+  input_map_.clear();
+  for (size_t i = 0; i < input_nodes_.size(); ++i) {
+    input_map_.emplace(nodes_[input_nodes_[i]].name, static_cast<uint32_t>(i));
+  }
+}
+
 void GraphRuntime::SetupStorage() {
   // Grab saved optimization plan from graph.
   std::vector<TVMType> vtype;
@@ -650,7 +662,6 @@ void GraphRuntime::SetupStorage() {
 }
 
 void GraphRuntime::SetupOpExecs() {
-  printf("\nSetupOpExecs ");
   op_execs_.resize(this->num_nodes());
   // setup the array and requirements.
   for (uint32_t nid = 0; nid < this->num_nodes(); ++nid) {
@@ -666,9 +677,6 @@ void GraphRuntime::SetupOpExecs() {
     }
     CHECK_EQ(inode.op_type, "tvm_op")
         << "Can only take tvm_op as op";
-
-    printf("\nNid = %d param.func_name =%s param.inputs=%d, param.outputs=%d inp_size=%ld ",
-        nid, inode.param.func_name.c_str(), inode.param.num_inputs , inode.param.num_outputs, inode.inputs.size());
     op_execs_[nid] = CreateTVMOp(inode.param, args, inode.inputs.size());
   }
 }
@@ -755,7 +763,9 @@ PackedFunc GraphRuntime::GetFunction(
       });
     } else if (name == "set_debug_buffer") {
       return PackedFunc([sptr_to_self, this](TVMArgs args, TVMRetValue* rv) {
-            this->SetDebugBuffer(args[0]);
+            for (int i = 0; i < args.num_args; ++i) {
+              this->SetDebugBuffer(args[i]);
+            }
         });
 #ifdef TVM_GRAPH_RUNTIME_DEBUG
   } else if (name == "debug_get_output") {
@@ -44,6 +44,56 @@ def test_graph_simple():
         out = mod.get_output(0, tvm.nd.empty((n,)))
         np.testing.assert_equal(out.asnumpy(), a + 1)
 
+    def check_set_input():
+        if not tvm.module.enabled("llvm"):
+            print("Skip because llvm is not enabled")
+            return
+        mlib = tvm.build(s, [A, B], "llvm", name="myadd")
+        mod = graph_runtime.create(graph, mlib, tvm.cpu(0))
+        a = np.random.uniform(size=(n,)).astype(A.dtype)
+        def check_output(x):
+            mod.run(x=x)
+            out = mod.get_output(0, tvm.nd.empty((n,)))
+            np.testing.assert_equal(out.asnumpy(), a + 1)
+        # NDArrays on the module context are passed as is.
+        check_output(tvm.nd.array(a))
+        assert not mod._input_cache
+        # Neither input can be passed to the runtime as a numpy view.
+        for x in [a.astype(a.dtype.newbyteorder()), np.repeat(a, 2)[::2]]:
+            assert not (x.dtype.isnative and x.flags['C_CONTIGUOUS'])
+            check_output(x)
+        # Inputs of the same shape and dtype refill one staging buffer.
+        staged = mod._input_cache["x"]
+        check_output(list(a))
+        assert mod._input_cache["x"] is staged
+        # Any other shape gets a new one.
+        check_output(np.repeat(a, 2).reshape(2, n)[:, ::2])
+        assert mod._input_cache["x"].shape == (2, 2)
+
+    def check_debug():
+        if not tvm.module.enabled("llvm"):
+            print("Skip because llvm is not enabled")
+            return
+        mlib = tvm.build(s, [A, B], "llvm", name="myadd")
+        mod = graph_runtime.create(graph, mlib, tvm.cpu(0), debug=True)
+        registered = []
+        set_debug_buffer = mod._set_debug_buffer
+        def count_set_debug_buffer(*buffers):
+            registered.append(len(buffers))
+            set_debug_buffer(*buffers)
+        mod._set_debug_buffer = count_set_debug_buffer
+        for _ in range(2):
+            a = np.random.uniform(size=(n,)).astype(A.dtype)
+            mod.run(x=a)
+            out = mod.get_output(0, tvm.nd.empty((n,)))
+            np.testing.assert_equal(out.asnumpy(), a + 1)
+            np.testing.assert_equal(mod.ndarraylist[0].asnumpy(), a)
+            np.testing.assert_equal(mod.ndarraylist[1].asnumpy(), a + 1)
+        # One buffer per node entry, registered on the first run only.
+        assert registered == [2]
+        mod.debug_verbose = True
+        mod.run(x=a)
+
     def check_remote():
         if not tvm.module.enabled("llvm"):
             print("Skip because llvm is not enabled")
@@ -63,9 +113,74 @@ def test_graph_simple():
         out = tvm.nd.empty((n,), ctx=ctx)
         out = mod.get_output(0, out)
         np.testing.assert_equal(out.asnumpy(), a + 1)
+        assert not mod._input_cache
+        # A local NDArray is staged on the remote context, not passed as is.
+        b = np.random.uniform(size=(n,)).astype(A.dtype)
+        mod.run(x=tvm.nd.array(b))
+        assert mod._input_cache["x"].ctx == ctx
+        out = mod.get_output(0, out)
+        np.testing.assert_equal(out.asnumpy(), b + 1)
 
     check_verify()
+    check_set_input()
+    check_debug()
     check_remote()
 
+def test_graph_multi_output():
+    n = 4
+    A = tvm.placeholder((n,), name='A')
+    B, C = tvm.compute(A.shape, lambda i: (A[i] + 1.0, A[i] * 2.0), name='B')
+    s = tvm.create_schedule(B.op)
+
+    node0 = {"op": "null", "name": "x", "inputs": []}
+    node1 = {"op": "tvm_op", "name": "add",
+             "inputs": [[0, 0, 0]],
+             "attrs": {"func_name": "myaddmul",
+                       "flatten_data": "1",
+                       "num_inputs" : "1",
+                       "num_outputs" : "2"}}
+    nodes = [node0, node1]
+    arg_nodes = [0]
+    node_row_ptr = [0, 1, 3]
+    outputs = [[1, 0, 0], [1, 1, 0]]
+    shape = (4,)
+    attrs = {
+        "shape" : ["list_shape", [shape, shape, shape]],
+        "dltype" : ["list_str", ["float32", "float32", "float32"]],
+        "storage_id" : ["list_int", [0, 1, 2]],
+    }
+    graph = {"nodes": nodes,
+             "arg_nodes": arg_nodes,
+             "node_row_ptr": node_row_ptr,
+             "heads": outputs,
+             "attrs": attrs}
+    graph = json.dumps(graph)
+
+    def check_debug():
+        if not tvm.module.enabled("llvm"):
+            print("Skip because llvm is not enabled")
+            return
+        mlib = tvm.build(s, [A, B, C], "llvm", name="myaddmul")
+        mod = graph_runtime.create(graph, mlib, tvm.cpu(0), debug=True)
+        a = np.random.uniform(size=(n,)).astype(A.dtype)
+        mod.run(x=a)
+        out = mod.get_output(1, tvm.nd.empty((n,)))
+        np.testing.assert_equal(out.asnumpy(), a * 2)
+        # Every output entry of node1 has its own debug buffer.
+        np.testing.assert_equal(mod.ndarraylist[0].asnumpy(), a)
+        np.testing.assert_equal(mod.ndarraylist[1].asnumpy(), a + 1)
+        np.testing.assert_equal(mod.ndarraylist[2].asnumpy(), a * 2)
+        try:
+            out = mod.debug_get_output("x", tvm.nd.empty((n,)))
+        except RuntimeError:
+            print("Skip because USE_GRAPH_RUNTIME_DEBUG is not enabled")
+            return
+        np.testing.assert_equal(out.asnumpy(), a)
+        out = mod.debug_get_output("add", tvm.nd.empty((n,)))
+        np.testing.assert_equal(out.asnumpy(), a + 1)
+
+    check_debug()
+
 if __name__ == "__main__":
     test_graph_simple()
+    test_graph_multi_output()